@@ -4,9 +4,22 @@ Automated setup script for YouTube to Spotify migrator.
 """
 
 import os
+import ast
 import sys
 import subprocess
+import glob
 import shutil
+import sysconfig
+from importlib.machinery import PathFinder
+
+# Interpreter inside the project virtual environment
+if os.name == 'nt':  # Windows
+    _VENV_PY = os.path.join('venv', 'Scripts', 'python.exe')
+else:
+    _VENV_PY = os.path.join('venv', 'bin', 'python')
+
+# The migrator module; its imports are what requirements.txt must provide
+_PROJECT_MODULE = 'youtube_to_spotify'
 
 def check_python_version():
     """Check if Python version is 3.8+"""
@@ -34,17 +47,20 @@ def create_virtual_environment():
 
 def install_dependencies():
     """Install required dependencies"""
-    venv_python = os.path.join('venv', 'bin', 'python')
-    if os.name == 'nt':  # Windows
-        venv_python = os.path.join('venv', 'Scripts', 'python.exe')
-    
-    if not os.path.exists(venv_python):
+    if not os.path.exists(_VENV_PY):
         print("❌ Virtual environment not found")
         return False
     
+    # uv resolves and downloads in parallel from a single binary; fall back to pip
+    uv = shutil.which('uv')
+    if uv:
+        command = [uv, 'pip', 'install', '--python', _VENV_PY, '-r', 'requirements.txt']
+    else:
+        command = [_VENV_PY, '-m', 'pip', 'install', '--prefer-binary', '-r', 'requirements.txt']
+    
     try:
         print("📦 Installing dependencies...")
-        subprocess.run([venv_python, '-m', 'pip', 'install', '-r', 'requirements.txt'], check=True)
+        subprocess.run(command, check=True)
         print("✅ Dependencies installed successfully")
         return True
     except subprocess.CalledProcessError:
@@ -53,62 +69,104 @@ def install_dependencies():
 
 def create_env_file():
     """Create .env file from template if it doesn't exist"""
-    if os.path.exists('.env'):
-        print("✅ .env file already exists")
-        return True
-    
-    if os.path.exists('.env.example'):
-        try:
-            shutil.copy('.env.example', '.env')
-            print("✅ Created .env file from template")
-            print("⚠️  Please edit .env file with your API credentials")
+    try:
+        with open('.env.example', 'rb') as template:
+            data = template.read()
+    except FileNotFoundError:
+        if os.path.exists('.env'):
+            print("✅ .env file already exists")
             return True
-        except Exception as e:
-            print(f"❌ Failed to create .env file: {e}")
-            return False
-    else:
         print("❌ .env.example template not found")
         return False
+    
+    try:
+        # 'x' mode fails atomically if .env is already there
+        with open('.env', 'xb') as env_file:
+            env_file.write(data)
+        print("✅ Created .env file from template")
+        print("⚠️  Please edit .env file with your API credentials")
+        return True
+    except FileExistsError:
+        print("✅ .env file already exists")
+        return True
+    except OSError as e:
+        print(f"❌ Failed to create .env file: {e}")
+        return False
+
+def _venv_site_packages():
+    """Locate the virtual environment's site-packages directories"""
+    # Globbed rather than derived from this interpreter, since an existing
+    # venv may have been built by a different Python version
+    if os.name == 'nt':  # Windows
+        return glob.glob(os.path.join('venv', 'Lib', 'site-packages'))
+    return glob.glob(os.path.join('venv', 'lib', 'python*', 'site-packages'))
+
+def _third_party_imports():
+    """Top-level non-stdlib modules imported by the migrator, read from its source"""
+    with open(f'{_PROJECT_MODULE}.py', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.partition('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.partition('.')[0])
+    
+    stdlib = sysconfig.get_path('stdlib')
+    platstdlib = sysconfig.get_path('platstdlib')
+    stdlib_dirs = [stdlib, platstdlib, os.path.join(platstdlib, 'lib-dynload')]
+    return sorted(name for name in names
+                  if name not in sys.builtin_module_names
+                  and PathFinder.find_spec(name, stdlib_dirs) is None)
 
 def test_installation():
     """Test if the installation works"""
-    venv_python = os.path.join('venv', 'bin', 'python')
-    if os.name == 'nt':  # Windows
-        venv_python = os.path.join('venv', 'Scripts', 'python.exe')
+    print("🧪 Testing installation...")
+    site_packages = _venv_site_packages()
+    if not site_packages:
+        print("❌ Installation test failed: venv site-packages not found")
+        return False
     
     try:
-        print("🧪 Testing installation...")
-        result = subprocess.run([
-            venv_python, '-c', 
-            'from youtube_to_spotify import TitleParser; print("Import successful")'
-        ], capture_output=True, text=True, check=True)
-        print("✅ Installation test passed")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Installation test failed: {e}")
+        required = _third_party_imports()
+    except (OSError, SyntaxError) as e:
+        print(f"❌ Installation test failed: could not read {_PROJECT_MODULE}.py: {e}")
+        return False
+    
+    # Look the migrator's imports up in the venv only, without starting its
+    # interpreter; a missing one means requirements.txt is out of date
+    missing = [name for name in required
+               if PathFinder.find_spec(name, site_packages) is None]
+    if missing:
+        print(f"❌ Installation test failed: missing {', '.join(missing)} in {', '.join(site_packages)}")
         return False
+    
+    print("✅ Installation test passed")
+    return True
 
 def print_next_steps():
-
-    print("\n" + "="*60)
-    print("[SETUP COMPLETE]")
-    print("="*60)
-    print("\nNext steps:")
-    print("1. Edit the .env file with your API credentials:")
-    print("   - YouTube Data API v3 key")
-    print("   - Spotify Client ID and Secret")
-    print("   - Your Spotify username")
-    print("\n2. Activate the virtual environment:")
-    if os.name == 'nt':
-        print("   venv\\Scripts\\activate")
-    else:
-        print("   source venv/bin/activate")
-    print("\n3. Run the migration tool:")
-    print("   python youtube_to_spotify.py")
-    print("\n4. Or try the demo:")
-    print("   python example_usage.py")
-    print("\nFor detailed setup instructions, see README.md")
-    print("="*60)
+    """Print what to do after setup, as a single write"""
+    activate = "venv\\Scripts\\activate" if os.name == 'nt' else "source venv/bin/activate"
+    lines = [
+        "\n" + "="*60,
+        "[SETUP COMPLETE]",
+        "="*60,
+        "\nNext steps:",
+        "1. Edit the .env file with your API credentials:",
+        "   - YouTube Data API v3 key",
+        "   - Spotify Client ID and Secret",
+        "   - Your Spotify username",
+        "\n2. Activate the virtual environment:",
+        f"   {activate}",
+        "\n3. Run the migration tool:",
+        "   python youtube_to_spotify.py",
+        "\n4. Or try the demo:",
+        "   python example_usage.py",
+        "\nFor detailed setup instructions, see README.md",
+        "="*60,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main setup function"""
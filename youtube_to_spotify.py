@@ -9,17 +9,26 @@ Uses video titles and channel names for accurate track identification.
 import os
 import re
 import csv
+import json
 import time
 import base64
 import logging
 import urllib.parse
+import threading
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Union
 from dataclasses import dataclass
-from fuzzywuzzy import fuzz # type: ignore
 
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from rapidfuzz import fuzz, process, utils
 from dotenv import load_dotenv
 
 
@@ -37,6 +46,94 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns
+_PLAYLIST_RE = re.compile(r'[?&]list=([a-zA-Z0-9_-]+)')
+
+# Title clean-up: bracketed noise such as [Official Video] and featured artists
+# are removed in one pass, then whitespace is collapsed
+_JUNK_RE = re.compile(r'\[.*?\]|\(.*?\)|(?:feat\.|ft\.|featuring)\s+.+', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+# Trailing channel-name words that aren't part of the artist name. Case-sensitive
+# on purpose: only these spellings are stripped, so 'Protv' or 'Mtv' stay intact
+_CHANNEL_SUFFIX_RE = re.compile(
+    r'(?:\s*(?:Official|OFFICIAL|Records|RECORDS|Music|MUSIC|Channel|CHANNEL|TV|VEVO|vevo))+\s*$'
+)
+
+# Title layouts in one alternation; branches are tried in priority order,
+# so the first layout that fits the whole title wins
+_TITLE_RE = re.compile(
+    r'^(?:'
+    r'(?P<artist_dash>.+?)\s*-\s*(?P<song_dash>.+)'                       # Artist - Song
+    r'|(?P<artist_colon>.+?)\s*:\s*(?P<song_colon>.+)'                    # Artist: Song
+    r'|(?P<song_by>.+?)\s+by\s+(?P<artist_by>.+)'                         # Song by Artist
+    r'|(?P<artist_pipe>.+?)\s*\|\s*(?P<song_pipe>.+)'                     # Artist | Song
+    r'|(?P<artist_quote>.+?)\s*["\u201c](?P<song_quote>.+?)["\u201d]'      # Artist "Song"
+    r')$',
+    re.IGNORECASE
+)
+
+# Longer inputs are not real YouTube URLs; skip them before hitting the regex
+MAX_URL_LENGTH = 2048
+
+# Fuzzy match weighting (title is more important) and acceptance threshold
+TITLE_WEIGHT = 0.7
+ARTIST_WEIGHT = 0.3
+MATCH_THRESHOLD = 0.5
+
+# Only near-certain matches are remembered across runs, since a cached ID is
+# reused without searching again
+ID_CACHE_THRESHOLD = 0.9
+
+# Songs searched on Spotify at once; kept within the session pool size
+SEARCH_CONCURRENCY = 10
+
+# Spotify search responses kept in memory (duplicates and re-uploads are common)
+SEARCH_CACHE_SIZE = 2048
+
+# Spotify's /v1/tracks endpoint accepts at most 50 IDs per request
+TRACKS_BATCH_SIZE = 50
+
+@lru_cache(maxsize=4096)
+def _extract_playlist_id(url: str) -> Optional[str]:
+    """Cached playlist ID lookup keyed on the raw URL"""
+    if len(url) > MAX_URL_LENGTH:
+        return None
+    match = _PLAYLIST_RE.search(url)
+    return match.group(1) if match else None
+
+@lru_cache(maxsize=8192)
+def _normalize(text: str) -> str:
+    """Lowercase and blank out punctuation; cached since artists repeat across tracks"""
+    return utils.default_process(text)
+
+@lru_cache(maxsize=4096)
+def _similarity(text: str, other: str) -> float:
+    """Cached token-set similarity (0-100) of two normalized strings
+
+    Token-set scoring ignores word order and extra words, so "Beatles"
+    matches "The Beatles" and "Hey Jude" matches "Hey Jude - Live".
+    """
+    return fuzz.token_set_ratio(text, other)
+
+def _match_confidence(artist: str, title: str, spotify_artist: str, spotify_title: str) -> float:
+    """Weighted similarity of already-normalized strings"""
+    # Identical fields are common (e.g. from artist:/track: searches) and need no scoring
+    title_score = 100.0 if title and title == spotify_title else _similarity(title, spotify_title)
+    artist_score = 100.0 if artist and artist == spotify_artist else _similarity(artist, spotify_artist)
+
+    # Weighted average (title is more important)
+    return ((title_score * TITLE_WEIGHT) + (artist_score * ARTIST_WEIGHT)) / 100.0
+
+def _build_session() -> requests.Session:
+    """HTTP session with keep-alive connection pooling and adapter-level retries"""
+    # Retry-After is honoured for 429/503; allowed_methods=None retries POSTs too
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=None, raise_on_status=False)
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+    return session
+
 @dataclass
 class Song:
     """Represents a song with metadata"""
@@ -59,25 +156,26 @@ class MigrationStats:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
 
+@dataclass
+class PreparedCandidates:
+    """Normalized Spotify candidate fields, reusable across many queries"""
+    artists: np.ndarray
+    titles: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
 class YouTubeExtractor:
     """Handles YouTube playlist extraction using YouTube Data API v3"""
     
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://www.googleapis.com/youtube/v3"
+        self._session = _build_session()
         
     def extract_playlist_id(self, url: str) -> Optional[str]:
         """Extract playlist ID from various YouTube URL formats"""
-        patterns = [
-            r'list=([a-zA-Z0-9_-]+)',
-            r'playlist\?list=([a-zA-Z0-9_-]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        return _extract_playlist_id(url)
     
     def get_playlist_videos(self, playlist_id: str) -> List[Dict[str, str]]:
         """Get all video titles and channel names from a YouTube playlist with pagination"""
@@ -89,6 +187,8 @@ class YouTubeExtractor:
                 'part': 'snippet',
                 'playlistId': playlist_id,
                 'maxResults': 50,
+                # Only the fields read below; trims thumbnails, descriptions, etc.
+                'fields': 'nextPageToken,items(snippet(title,videoOwnerChannelTitle))',
                 'key': self.api_key
             }
 
@@ -96,9 +196,13 @@ class YouTubeExtractor:
                 params['pageToken'] = next_page_token
 
             try:
-                response = requests.get(f"{self.base_url}/playlistItems", params=params)
+                # 429/5xx are retried with Retry-After backoff by the session adapter
+                response = self._session.get(f"{self.base_url}/playlistItems", params=params)
+                if response.status_code == 403 and 'quotaExceeded' in response.text:
+                    logger.error("YouTube API daily quota exceeded; stopping playlist extraction")
+                    break
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 for item in data.get('items', []):
                     title = item['snippet']['title']
@@ -114,10 +218,7 @@ class YouTubeExtractor:
                 if not next_page_token:
                     break
 
-                # Rate limiting - YouTube allows 100 requests per 100 seconds
-                time.sleep(1)
-
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
                 logger.error(f"Error fetching playlist videos: {e}")
                 break
 
@@ -127,43 +228,22 @@ class YouTubeExtractor:
 class TitleParser:
     """Parses video titles to extract artist and song information"""
     
-    def __init__(self):
-        self.patterns = [
-            # Artist - Song
-            r'^(.+?)\s*-\s*(.+)$',
-            # Artist: Song
-            r'^(.+?)\s*:\s*(.+)$',
-            # Song by Artist
-            r'^(.+?)\s+by\s+(.+)$',
-            # Artist | Song
-            r'^(.+?)\s*\|\s*(.+)$',
-            # Artist "Song"
-            r'^(.+?)\s*["\u201c](.+?)["\u201d]$',
-        ]
-    
     def clean_text(self, text: str) -> str:
         """Clean common artifacts from titles"""
         # Remove common prefixes/suffixes
-        text = re.sub(r'\[.*?\]', '', text)  # Remove [Official Video], etc.
-        text = re.sub(r'\(.*?\)', '', text)  # Remove (Official Video), etc.
-        text = re.sub(r'(feat\.|ft\.|featuring)\s+.+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s+', ' ', text).strip()  # Normalize whitespace
+        text = _JUNK_RE.sub('', text)  # Remove [Official Video], (Official Video), feat. ..., etc.
+        text = _WS_RE.sub(' ', text).strip()  # Normalize whitespace
         return text
     
     def parse_title(self, title: str) -> Tuple[str, str]:
         """Parse video title to extract artist and song name"""
         title = self.clean_text(title)
         
-        for pattern in self.patterns:
-            match = re.match(pattern, title, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                if len(groups) == 2:
-                    # For "Song by Artist" pattern, swap the order
-                    if 'by' in pattern:
-                        return groups[1].strip(), groups[0].strip()  # artist, song
-                    else:
-                        return groups[0].strip(), groups[1].strip()  # artist, song
+        match = _TITLE_RE.match(title)
+        if match:
+            # The last group to close names the layout that matched
+            layout = match.lastgroup.split('_')[1]
+            return match[f'artist_{layout}'].strip(), match[f'song_{layout}'].strip()
         
         # Fallback: assume the whole title is the song name
         return "", title
@@ -171,12 +251,22 @@ class TitleParser:
 class SpotifyManager:
     """Handles Spotify Web API operations"""
 
-    def __init__(self, client_id: str, client_secret: str, user_id: str = ""):
+    def __init__(self, client_id: str, client_secret: str, user_id: str = "",
+                 refresh_cache: bool = False):
         self.client_id = client_id
         self.client_secret = client_secret
         self.user_id = user_id
         self.access_token = None
         self.base_url = "https://api.spotify.com/v1"
+        self._session_base = self.base_url + '/'
+        self._session = _build_session()
+        self._search_cache = OrderedDict()  # query -> tracks, in LRU order
+        self._search_cache_lock = threading.Lock()
+        # Track IDs of good matches from earlier runs, keyed by (artist, title)
+        self._id_cache_path = "spotify_cache.json"
+        # refresh_cache starts from an empty cache, which replaces the file on save
+        self._id_cache: Dict[str, str] = {} if refresh_cache else self._load_id_cache()
+        self._track_cache: Dict[str, Dict] = {}  # track ID -> prefetched track
         self._authenticate()
 
         # Auto-detect user ID if not provided or is placeholder
@@ -221,9 +311,10 @@ class SpotifyManager:
         # Get authorization code from user
         while True:
             callback_url = input("\nPaste the callback URL here: ").strip()
-            if 'code=' in callback_url:
+            _, found, query = callback_url.partition('code=')
+            if found:
                 # Extract code from URL
-                code = callback_url.split('code=')[1].split('&')[0]
+                code = query.partition('&')[0]
                 print("✅ Authorization code received!")
                 break
             else:
@@ -252,12 +343,13 @@ class SpotifyManager:
         }
 
         try:
-            response = requests.post(token_url, headers=headers, data=data)
+            response = self._session.post(token_url, headers=headers, data=data)
             response.raise_for_status()
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             self.access_token = token_data["access_token"]
+            self._session.headers['Authorization'] = f"Bearer {self.access_token}"
             logger.info("✅ Successfully authenticated with Spotify (with playlist permissions)")
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Token exchange failed: {e}")
             raise
 
@@ -287,59 +379,117 @@ class SpotifyManager:
                     print("❌ User ID cannot be empty")
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict]:
-        """Make authenticated request to Spotify API with retry logic"""
-        url = f"{self.base_url}/{endpoint}"
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        
-        for attempt in range(3):
-            try:
-                response = requests.request(method, url, headers=headers, **kwargs)
-                
-                if response.status_code == 429:  # Rate limited
-                    retry_after = int(response.headers.get('Retry-After', 1))
-                    logger.warning(f"Rate limited, waiting {retry_after} seconds")
-                    time.sleep(retry_after)
-                    continue
-                
-                response.raise_for_status()
-                return response.json() if response.content else {}
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request attempt {attempt + 1} failed: {e}")
-                if attempt == 2:  # Last attempt
-                    logger.error(f"All attempts failed for {endpoint}")
-                    return None
-                time.sleep(2 ** attempt)  # Exponential backoff
-        
-        return None
+        """Make authenticated request to Spotify API (retries and backoff happen in the session adapter)"""
+        try:
+            # The Bearer token already lives on the session headers
+            response = self._session.request(method, self._session_base + endpoint, **kwargs)
+            response.raise_for_status()
+            return orjson.loads(response.content) if response.content else {}
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error(f"Request failed for {endpoint}: {e}")
+            return None
 
     def search_track(self, artist: str, title: str) -> Optional[Dict]:
-        """Search for a track on Spotify with intelligent search strategies"""
-        # Strategy 1: Exact artist and track search
-        if artist and title:
-            query = f'artist:"{artist}" track:"{title}"'
-            result = self._search_with_query(query)
-            if result:
-                return result
+        """Search for a track on Spotify and pick the best result client-side"""
+        if not title:
+            return None
 
-        # Strategy 2: General search with both artist and title
-        if artist and title:
-            query = f'"{artist}" "{title}"'
-            result = self._search_with_query(query)
-            if result:
-                return result
+        # Songs matched in an earlier run and prefetched by warm_track_cache
+        cache_key = self._id_cache_key(artist, title)
+        cached_track = self._track_cache.get(self._id_cache.get(cache_key, ''))
+        if cached_track:
+            return cached_track
+
+        # One broad query usually contains the right track among its results
+        tracks = self._search_with_query(f'{artist} {title}'.strip())
+        best, confidence = self._best_match(artist, title, tracks)
+
+        # Only pay for a narrowed artist/track query when the broad results look wrong
+        if artist and not FuzzyMatcher.is_good_match(confidence):
+            tracks = self._search_with_query(f'artist:"{artist}" track:"{title}"')
+            narrowed, narrowed_confidence = self._best_match(artist, title, tracks)
+            if narrowed and narrowed_confidence > confidence:
+                best, confidence = narrowed, narrowed_confidence
+
+        if best and FuzzyMatcher.is_good_match(confidence, ID_CACHE_THRESHOLD):
+            self._id_cache[cache_key] = best['id']
+        return best
+
+    def warm_track_cache(self, queries: List[Tuple[str, str]]) -> int:
+        """Prefetch cached tracks for (artist, title) queries in batches; returns how many resolved"""
+        track_ids = {
+            self._id_cache[key]
+            for key in (self._id_cache_key(artist, title) for artist, title in queries)
+            if key in self._id_cache
+        }
+        missing = [track_id for track_id in track_ids if track_id not in self._track_cache]
 
-        # Strategy 3: Search with just the title
-        if title:
-            query = f'"{title}"'
-            result = self._search_with_query(query)
-            if result:
-                return result
+        for i in range(0, len(missing), TRACKS_BATCH_SIZE):
+            batch = missing[i:i + TRACKS_BATCH_SIZE]
+            data = self._make_request('GET', 'tracks', params={'ids': ','.join(batch)})
+            for track in (data or {}).get('tracks') or []:
+                if track:  # Unavailable IDs come back as null
+                    self._track_cache[track['id']] = track
 
-        return None
+        return sum(1 for track_id in track_ids if track_id in self._track_cache)
+
+    def save_id_cache(self):
+        """Persist matched track IDs for the next migration"""
+        try:
+            with open(self._id_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._id_cache, f)
+        except OSError as e:
+            logger.warning(f"Could not save Spotify track cache: {e}")
+
+    def _load_id_cache(self) -> Dict[str, str]:
+        """Load matched track IDs saved by a previous migration"""
+        try:
+            with open(self._id_cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable Spotify track cache: {e}")
+            return {}
+
+        if not isinstance(cache, dict):
+            logger.warning("Ignoring Spotify track cache that is not a JSON object")
+            return {}
+
+        # Keep only "artist|title" -> track ID string entries
+        valid = {key: track_id for key, track_id in cache.items()
+                 if isinstance(key, str) and isinstance(track_id, str) and track_id}
+        if len(valid) < len(cache):
+            logger.warning(f"Dropped {len(cache) - len(valid)} malformed Spotify track cache entries")
+        return valid
+
+    @staticmethod
+    def _id_cache_key(artist: str, title: str) -> str:
+        """Cache key for a parsed song; normalization blanks out the separator"""
+        return f"{_normalize(artist)}|{_normalize(title)}"
+
+    def _best_match(self, artist: str, title: str, tracks: List[Dict]) -> Tuple[Optional[Dict], float]:
+        """Return the track with the highest match confidence and that confidence"""
+        if not tracks:
+            return None, 0.0
+
+        # argmax keeps the earliest of tied scores (e.g. no artist to compare),
+        # so ties follow Spotify's own relevance order
+        scores = FuzzyMatcher.rank(
+            artist, title, [(track['artists'][0]['name'], track['name']) for track in tracks]
+        )
+        index = int(np.argmax(scores))
+        return tracks[index], float(scores[index])
+
+    def _search_with_query(self, query: str) -> List[Dict]:
+        """Execute search query and return the candidate tracks"""
+        # Spotify search is case-insensitive, so case variants share an entry
+        key = query.lower()
+        with self._search_cache_lock:
+            if key in self._search_cache:
+                self._search_cache.move_to_end(key)
+                return self._search_cache[key]
 
-    def _search_with_query(self, query: str) -> Optional[Dict]:
-        """Execute search query and return best match"""
         params = {
             'q': query,
             'type': 'track',
@@ -348,14 +498,14 @@ class SpotifyManager:
 
         data = self._make_request('GET', 'search', params=params)
         if not data or 'tracks' not in data:
-            return None
+            return []  # Failed requests are not cached
 
         tracks = data['tracks']['items']
-        if not tracks:
-            return None
-
-        # Return the first (most relevant) track
-        return tracks[0]
+        with self._search_cache_lock:
+            self._search_cache[key] = tracks
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return tracks
 
     def create_playlist(self, name: str, description: str = "", public: bool = True) -> Optional[str]:
         """Create a new Spotify playlist"""
@@ -394,21 +544,65 @@ class FuzzyMatcher:
 
     @staticmethod
     def calculate_match_confidence(original_artist: str, original_title: str,
-                                 spotify_artist: str, spotify_title: str) -> float:
-        """Calculate confidence score for a Spotify match"""
+                                 spotify_artist: str, spotify_title: str,
+                                 cutoff: float = 0.0) -> float:
+        """Calculate confidence score for a Spotify match
+
+        Scores below ``cutoff`` are reported as 0.0 rather than their exact value.
+        """
         if not original_artist or not original_title:
             return 0.0
 
-        # Calculate similarity scores
-        artist_score = fuzz.ratio(original_artist.lower(), spotify_artist.lower())
-        title_score = fuzz.ratio(original_title.lower(), spotify_title.lower())
+        artist, title = _normalize(original_artist), _normalize(original_title)
+        spotify_artist, spotify_title = _normalize(spotify_artist), _normalize(spotify_title)
+
+        # Exact catalog hits are common; skip scoring and the cache entirely
+        if artist and title and artist == spotify_artist and title == spotify_title:
+            return 1.0
 
-        # Weighted average (title is more important)
-        confidence = (title_score * 0.7) + (artist_score * 0.3)
-        return confidence / 100.0
+        confidence = _match_confidence(artist, title, spotify_artist, spotify_title)
+        return confidence if confidence >= cutoff else 0.0
 
     @staticmethod
-    def is_good_match(confidence: float, threshold: float = 0.5) -> bool:
+    def prepare_candidates(candidates: List[Tuple[str, str]]) -> PreparedCandidates:
+        """Normalize (artist, title) candidates once so they can be ranked repeatedly"""
+        artists = np.array([_normalize(artist) for artist, _ in candidates], dtype=object)
+        titles = np.array([_normalize(title) for _, title in candidates], dtype=object)
+        return PreparedCandidates(artists=artists, titles=titles)
+
+    @staticmethod
+    def rank(original_artist: str, original_title: str,
+             candidates: Union[List[Tuple[str, str]], PreparedCandidates]) -> np.ndarray:
+        """Score one song against many (artist, title) Spotify candidates in a single batch"""
+        # Single-threaded: a 1xN row is too small to pay for a thread pool, and
+        # searches already run in parallel across the migration's worker threads
+        return FuzzyMatcher.batch_confidence([(original_artist, original_title)], candidates,
+                                             workers=1)[0]
+
+    @staticmethod
+    def batch_confidence(queries: List[Tuple[str, str]],
+                         candidates: Union[List[Tuple[str, str]], PreparedCandidates],
+                         workers: int = -1) -> np.ndarray:
+        """Score every (artist, title) query against every candidate as a 0-1 matrix"""
+        if not isinstance(candidates, PreparedCandidates):
+            candidates = FuzzyMatcher.prepare_candidates(candidates)
+
+        # One C++ call per field instead of one Python round-trip per pair; cdist
+        # releases the GIL and by default spreads rows across all cores. float64
+        # keeps scores identical to calculate_match_confidence at the threshold
+        artist_scores = process.cdist([_normalize(artist) for artist, _ in queries], candidates.artists,
+                                      scorer=fuzz.token_set_ratio, dtype=np.float64, workers=workers)
+        title_scores = process.cdist([_normalize(title) for _, title in queries], candidates.titles,
+                                     scorer=fuzz.token_set_ratio, dtype=np.float64, workers=workers)
+
+        # Same weighting as calculate_match_confidence
+        confidence = ((title_scores * TITLE_WEIGHT) + (artist_scores * ARTIST_WEIGHT)) / 100.0
+        # Queries missing an artist or title score 0.0, as in calculate_match_confidence
+        confidence[[not artist or not title for artist, title in queries]] = 0.0
+        return confidence
+
+    @staticmethod
+    def is_good_match(confidence: float, threshold: float = MATCH_THRESHOLD) -> bool:
         """Determine if a match meets the confidence threshold"""
         return confidence >= threshold
 
@@ -425,7 +619,7 @@ class MigrationReporter:
         filename = f"migration_report_{timestamp}.csv"
         filepath = os.path.join(self.output_dir, filename)
 
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             fieldnames = [
                 'Original YouTube Title',
                 'YouTube Channel',
@@ -437,20 +631,14 @@ class MigrationReporter:
                 'Error Details'
             ]
 
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for song in songs:
-                writer.writerow({
-                    'Original YouTube Title': song.original_title,
-                    'YouTube Channel': song.channel_name,
-                    'Parsed Artist': song.artist,
-                    'Parsed Song Title': song.title,
-                    'Spotify Match Found': 'Y' if song.found else 'N',
-                    'Spotify Track URI': song.spotify_uri,
-                    'Match Confidence Score': f"{song.match_confidence:.2f}",
-                    'Error Details': song.error
-                })
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (song.original_title, song.channel_name, song.artist, song.title,
+                 'Y' if song.found else 'N', song.spotify_uri,
+                 f"{song.match_confidence:.2f}", song.error)
+                for song in songs
+            )
 
         logger.info(f"CSV report generated: {filepath}")
         return filepath
@@ -484,6 +672,8 @@ class PlaylistMigrator:
         spotify_client_id = os.getenv('SPOTIFY_CLIENT_ID')
         spotify_client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
         spotify_user_id = os.getenv('SPOTIFY_USER_ID', '')  # Optional, can be auto-detected
+        # Optional: ignore and overwrite spotify_cache.json from earlier runs
+        refresh_cache = os.getenv('SPOTIFY_REFRESH_CACHE', '').lower() in ('1', 'true', 'yes')
 
         if not all([youtube_api_key, spotify_client_id, spotify_client_secret]):
             raise ValueError("Missing required environment variables")
@@ -494,7 +684,8 @@ class PlaylistMigrator:
         assert spotify_client_secret is not None
 
         self.youtube = YouTubeExtractor(youtube_api_key)
-        self.spotify = SpotifyManager(spotify_client_id, spotify_client_secret, spotify_user_id)
+        self.spotify = SpotifyManager(spotify_client_id, spotify_client_secret, spotify_user_id,
+                                      refresh_cache)
         self.parser = TitleParser()
         self.reporter = MigrationReporter()
         self.matcher = FuzzyMatcher()
@@ -520,24 +711,33 @@ class PlaylistMigrator:
 
             print(f"📋 Found {len(video_titles)} videos to process")
 
-            # Process each video
+            # Resolve songs matched in earlier runs with batched track lookups
+            cached = self.spotify.warm_track_cache([self._parse_video(v) for v in video_titles])
+            if cached:
+                print(f"💾 {cached} tracks loaded from the local Spotify cache")
+
+            # Process videos concurrently; each search is an I/O-bound round-trip
+            # to Spotify, and map() still yields results in playlist order
             print("🔍 Searching for matches on Spotify...")
-            for i, video_data in enumerate(video_titles, 1):
-                song = self._process_song(video_data)
-                songs.append(song)
-
-                # Update statistics
-                if song.found:
-                    stats.successful_matches += 1
-                elif song.error:
-                    stats.errors += 1
-                else:
-                    stats.not_found += 1
+            with ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY) as executor:
+                for i, song in enumerate(executor.map(self._process_song, video_titles), 1):
+                    songs.append(song)
+
+                    # Update statistics
+                    if song.found:
+                        stats.successful_matches += 1
+                    elif song.error:
+                        stats.errors += 1
+                    else:
+                        stats.not_found += 1
+
+                    # Progress indicator on its own stdout line, so worker errors
+                    # logged to stderr never land on top of it
+                    if i % 25 == 0 or i == len(video_titles):
+                        progress = (i / len(video_titles)) * 100
+                        print(f"Progress: {i}/{len(video_titles)} ({progress:.1f}%)")
 
-                # Progress indicator
-                if i % 10 == 0 or i == len(video_titles):
-                    progress = (i / len(video_titles)) * 100
-                    print(f"Progress: {i}/{len(video_titles)} ({progress:.1f}%)")
+            self.spotify.save_id_cache()
 
             # Create Spotify playlist
             print("📝 Creating Spotify playlist...")
@@ -575,17 +775,8 @@ class PlaylistMigrator:
         song = Song(original_title=title, channel_name=channel)
 
         try:
-            # Parse title to extract artist and song
-            parsed_artist, song_title = self.parser.parse_title(title)
-
-            # Use channel name as artist if no artist was parsed from title
-            if not parsed_artist and channel:
-                # Clean up channel name (remove common suffixes)
-                clean_channel = self._clean_channel_name(channel)
-                artist = clean_channel
-            else:
-                artist = parsed_artist
-
+            # Parse title (falling back to the channel) to extract artist and song
+            artist, song_title = self._parse_video(video_data)
             song.artist = artist
             song.title = song_title
 
@@ -597,7 +788,8 @@ class PlaylistMigrator:
                 spotify_artist = spotify_track['artists'][0]['name']
                 spotify_title = spotify_track['name']
 
-                # Calculate match confidence
+                # Calculate match confidence; no cutoff, so near-misses keep their
+                # real score in the report
                 confidence = self.matcher.calculate_match_confidence(
                     artist, song_title, spotify_artist, spotify_title
                 )
@@ -617,25 +809,26 @@ class PlaylistMigrator:
 
         return song
 
+    def _parse_video(self, video_data: Dict[str, str]) -> Tuple[str, str]:
+        """Work out the artist and song title for a YouTube video"""
+        channel = video_data['channel']
+
+        # Parse title to extract artist and song
+        parsed_artist, song_title = self.parser.parse_title(video_data['title'])
+
+        # Use channel name as artist if no artist was parsed from title
+        if not parsed_artist and channel:
+            # Clean up channel name (remove common suffixes)
+            return self._clean_channel_name(channel), song_title
+        return parsed_artist, song_title
+
     def _clean_channel_name(self, channel: str) -> str:
         """Clean channel name to make it more suitable as artist name"""
         if not channel:
             return ""
 
         # Remove common suffixes that aren't part of artist names
-        suffixes_to_remove = [
-            'Official', 'OFFICIAL', 'Records', 'RECORDS', 'Music', 'MUSIC',
-            'Channel', 'CHANNEL', 'TV', 'VEVO', 'vevo'
-        ]
-
-        cleaned = channel
-        for suffix in suffixes_to_remove:
-            if cleaned.endswith(f' {suffix}'):
-                cleaned = cleaned[:-len(f' {suffix}')]
-            elif cleaned.endswith(suffix):
-                cleaned = cleaned[:-len(suffix)]
-
-        return cleaned.strip()
+        return _CHANNEL_SUFFIX_RE.sub('', channel).strip()
 
     def _enhanced_spotify_search(self, artist: str, title: str, channel: str) -> Optional[Dict]:
         """Enhanced Spotify search using multiple strategies"""